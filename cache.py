@@ -0,0 +1,152 @@
+from collections import OrderedDict
+import hashlib
+import os
+import time
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+
+# Kept in the user's cache folder, never in the working directory: loading a pickle runs code.
+# Set RATIO_CACHE_DIR to keep it somewhere else.
+CACHE_DIR = Path(
+    os.environ.get("RATIO_CACHE_DIR", Path.home() / ".cache" / "ratio-calc")
+)
+
+# Data ending today can still change, older date ranges are settled.
+RECENT_TTL = 24 * 60 * 60
+HISTORICAL_TTL = 30 * 24 * 60 * 60
+
+# Number of DataFrames kept in memory in front of the disk cache.
+MAX_MEMORY_ENTRIES = 128
+
+
+class FileCache:
+    """
+    On-disk cache for downloaded stock data.
+    Entries are pickled DataFrames keyed by the ticker and date range they were fetched for.
+    The most recently used entries are also kept in memory, so repeated lookups skip the disk.
+
+    Functions:
+        get: Get the cached stock data for a ticker and date range.
+        set: Cache the stock data for a ticker and date range.
+    """
+
+    def __init__(
+        self, cache_dir: Path = CACHE_DIR, max_memory_entries: int = MAX_MEMORY_ENTRIES
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        self.memory: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+
+    def get(self, ticker: str, start: str, end: str) -> Optional[pd.DataFrame]:
+        """
+        Get the cached stock data for a ticker and date range.
+
+        Args:
+            ticker (str): The stock ticker symbol.
+            start (str): The start date of the cached data.
+            end (str): The end date of the cached data.
+
+        Returns:
+            pd.DataFrame: The cached stock data, or None if it is missing or expired.
+
+        Examples:
+            >>> FileCache().get("AAPL", "2021-01-01", "2021-12-31")
+        """
+        key = self.__key__(ticker, start, end)
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key].copy()
+
+        path = self.__entry_path__(key)
+        try:
+            age = time.time() - path.stat().st_mtime
+        except OSError:
+            return None
+        if age > self.__ttl__(end):
+            self.__discard__(path)
+            return None
+
+        try:
+            data = pd.read_pickle(path)
+        # A corrupt or unreadable entry is treated like a miss.
+        except Exception:
+            self.__discard__(path)
+            return None
+
+        self.__remember__(key, data)
+        return data.copy()
+
+    def set(self, ticker: str, start: str, end: str, data: pd.DataFrame) -> None:
+        """
+        Cache the stock data for a ticker and date range.
+
+        Args:
+            ticker (str): The stock ticker symbol.
+            start (str): The start date of the data.
+            end (str): The end date of the data.
+            data (pd.DataFrame): The stock data to cache.
+
+        Examples:
+            >>> FileCache().set("AAPL", "2021-01-01", "2021-12-31", data)
+        """
+        key = self.__key__(ticker, start, end)
+        self.__remember__(key, data.copy())
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            data.to_pickle(self.__entry_path__(key))
+        # Failing to write the cache should never stop the analysis.
+        except OSError as e:
+            print(f"Could not write cache: {e}")
+            return
+        self.__prune__()
+
+    def __prune__(self) -> None:
+        """
+        Delete the entries older than the longest TTL.
+        Keys include the end date, so entries ending on an earlier day are never looked up again and only go away here.
+        """
+
+        cutoff = time.time() - HISTORICAL_TTL
+        for path in self.cache_dir.glob("*.pkl"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+    def __discard__(self, path: Path) -> None:
+        """Delete an expired or unreadable cache file."""
+
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def __remember__(self, key: str, data: pd.DataFrame) -> None:
+        """Keep an entry in memory, dropping the least recently used one when full."""
+
+        self.memory[key] = data
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory_entries:
+            self.memory.popitem(last=False)
+
+    def __key__(self, ticker: str, start: str, end: str) -> str:
+        """Build the cache key for a ticker and date range."""
+
+        return hashlib.md5(f"{ticker}|{start}|{end}".encode()).hexdigest()
+
+    def __entry_path__(self, key: str) -> Path:
+        """Get the path of the cache file for a key."""
+
+        return self.cache_dir / f"{key}.pkl"
+
+    def __ttl__(self, end: str) -> int:
+        """Get how long, in seconds, data ending on the given date stays valid."""
+
+        if end >= date.today().isoformat():
+            return RECENT_TTL
+        return HISTORICAL_TTL
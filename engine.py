@@ -1,17 +1,79 @@
 # External Imports
-from datetime import datetime
+from datetime import date
 from typing import Any
 import sys
 
 # Internal Imports
 from ratio_calculator import RatioCalculator
 from manager import PortfolioManager, PorfolioJSONError
-from validations import validate_input
+from validations import get_validator
 from yfinance_wrapper import TickerDataError
 
 
 TOTAL_INVALID_ATTEMPTS = 5
 
+EXIT_COMMANDS = frozenset({"quit", "exit"})
+
+# Returned by Engine.input when the user types 'quit'.
+QUIT = object()
+
+BANNER = "\n".join(
+    [
+        "\n",
+        "*****************************************",
+        "Welcome to the STOCK ANALYSIS ENGINE",
+        "*****************************************",
+        "This engine allows you to analyze stocks and portfolios.",
+        "\nInstructions:",
+        "Type 'exit' or Ctrl+C at any point of time to exit.",
+        "Type 'quit' to exit the current module or exit engine in module selection.\n",
+    ]
+)
+
+RATIO_CALCULATOR_BANNER = "\n".join(
+    [
+        "\n****************************",
+        "***** Ratio Calculator *****",
+        "****************************\n",
+        "This module can calculate a few metrics about any ticker.",
+        "Enter 'quit' to exit the module.\n",
+    ]
+)
+
+PORTFOLIO_MANAGER_BANNER = "\n".join(
+    [
+        "\n*****************************",
+        "***** PORTFOLIO MANAGER *****",
+        "*****************************\n",
+        "You can either load a portfolio from a file or enter stocks manually.",
+        "Enter 'quit' to exit the module.",
+        "\nPlots will be saved under /portfolio_analysis folder.",
+        "WARNING: Files in the folder with the same names will be overwritten. Please save those files somewhere else if you require them\n\n",
+    ]
+)
+
+MODULE_PROMPT = "\n".join(
+    [
+        "\nWhat module would you like to use:",
+        "1. Ratio Calculator",
+        "2. Portfolio Manager",
+        "Enter 1 or 2 or quit/exit >> ",
+    ]
+)
+
+RATIO_PROMPT = "\n".join(
+    [
+        "What metric would you like to calculate:",
+        "1. Price to Earnings Ratio",
+        "2. Price Change Percentage",
+        "3. Volume Weighted Average Price ",
+        "4. Relative Strength Index",
+        "5. Average True Range",
+        "6. Calculate Everything",
+        ">> ",
+    ]
+)
+
 
 class Engine:
     """
@@ -23,51 +85,37 @@ class Engine:
         run_portfolio_manager: Run the portfolio manager module.
         input: Take input from the user. Validate the input. Exit the engine if too many invalid attempts.
         __mark_invalid_attempt__: Mark an invalid attempt. Exits the engine if too many invalid attempts.
+        __leave_module__: Leave the current module and go back to module selection.
         __exit_engine__: Exit the engine.
     """
 
+    __slots__ = ("invalid_attempts", "selector", "modules")
+
     def __init__(self) -> None:
         self.invalid_attempts = 0
+        self.selector = None
+        self.modules = {
+            "1": self.ratio_calculator,
+            "2": self.run_portfolio_manager,
+        }
 
     def run(self) -> None:
         """
         Run the engine.
         The user can select a module to run.
         """
-        print("\n")
-        print("*****************************************")
-        print("Welcome to the STOCK ANALYSIS ENGINE")
-        print("*****************************************")
-        print("This engine allows you to analyze stocks and portfolios.")
-        print("\nInstructions:")
-        print("Type 'exit' or Ctrl+C at any point of time to exit.")
-        print(
-            "Type 'quit' to exit the current module or exit engine in module selection."
-        )
+        sys.stdout.write(BANNER)
 
         while True:
             try:
-                if not hasattr(self, "selector"):
-                    self.selector = None
-
                 if self.selector is None:
-                    self.selector = input(
-                        "\n".join(
-                            [
-                                "\nWhat module would you like to use:",
-                                "1. Ratio Calculator",
-                                "2. Portfolio Manager",
-                                "Enter 1 or 2 or quit/exit >> ",
-                            ]
-                        )
-                    )
-                    if self.selector == "quit" or self.selector == "exit":
+                    self.selector = input(MODULE_PROMPT)
+                    if self.selector in EXIT_COMMANDS:
                         self.__exit_engine__()
 
-                if self.selector == "1":
-                    self.ratio_calculator()
-                elif self.selector == "2":
-                    self.run_portfolio_manager()
+                module = self.modules.get(self.selector)
+                if module is not None:
+                    module()
                 else:
                     print("Invalid module. Please try again.\n")
                     self.__mark_invalid_attempt__()
@@ -86,63 +134,54 @@ class Engine:
         Run the ratio calculator module.
         The user can calculate the price-to-earnings ratio for a stock.
         """
-        print("\n****************************")
-        print("***** Ratio Calculator *****")
-        print("****************************\n")
-        print("This module can calculate a few metrics about any ticker.")
-        print("Enter 'quit' to exit the module.")
+        sys.stdout.write(RATIO_CALCULATOR_BANNER)
         try:
             ticker = self.input("Enter the ticker: ")
+            if ticker is QUIT:
+                return self.__leave_module__("ratio calculator")
 
             start = self.input("Enter the start date (yyyy-mm-dd): ", type="date")
+            if start is QUIT:
+                return self.__leave_module__("ratio calculator")
 
             end = self.input(
                 "Enter the end date (yyyy-mm-dd): ", optional=True, type="date"
             )
+            if end is QUIT:
+                return self.__leave_module__("ratio calculator")
             if not end:
-                end = str(datetime.now().date())
+                end = date.today().isoformat()
 
             ratio_calculator = RatioCalculator(ticker, start, end)
+            metrics = {
+                1: ratio_calculator.calculate_pe_ratio,
+                2: ratio_calculator.calculate_pc_percent,
+                3: ratio_calculator.calculate_vwap,
+                4: ratio_calculator.calculate_rsi,
+                5: ratio_calculator.calculate_atr,
+                6: ratio_calculator.calculate_all,
+            }
             while True:
-                ratio_to_calculate = self.input(
-                    "\n".join(
-                        [
-                            "What metric would you like to calculate:",
-                            "1. Price to Earnings Ratio",
-                            "2. Price Change Percentage",
-                            "3. Volume Weighted Average Price ",
-                            "4. Relative Strength Index",
-                            "5. Average True Range",
-                            "6. Calculate Everything",
-                            ">> ",
-                        ]
-                    ),
-                    type="int",
-                )
-                return_value = None
-                if ratio_to_calculate == 1:
-                    return_value = ratio_calculator.calculate_pe_ratio()
-                elif ratio_to_calculate == 2:
-                    return_value = ratio_calculator.calculate_pc_percent()
-                elif ratio_to_calculate == 3:
-                    return_value = ratio_calculator.calculate_vwap()
-                elif ratio_to_calculate == 4:
-                    return_value = ratio_calculator.calculate_rsi()
-                elif ratio_to_calculate == 5:
-                    return_value = ratio_calculator.calculate_atr()
-                elif ratio_to_calculate == 6:
-                    temp = ratio_calculator.calculate_all()
-                    for key, value in temp.items():
-                        print(f"{key}: ")
-                        print(value)
-                else:
+                ratio_to_calculate = self.input(RATIO_PROMPT, type="int")
+                if ratio_to_calculate is QUIT:
+                    return self.__leave_module__("ratio calculator")
+                metric = metrics.get(ratio_to_calculate)
+                if metric is None:
                     print("Please enter a valid value or enter quit/exit\n")
-                if return_value is not None:
-                    print(return_value)
+                else:
+                    return_value = metric()
+                    if isinstance(return_value, dict):
+                        for key, value in return_value.items():
+                            print(f"{key}: ")
+                            print(value)
+                    else:
+                        print(return_value)
                 to_continue = self.input(
                     "Would you like to calculate another metric? (yes/no): ",
                     type="acceptance",
                 )
+                if to_continue is QUIT:
+                    return self.__leave_module__("ratio calculator")
                 if not to_continue:
                     break
 
@@ -150,6 +189,8 @@ class Engine:
                 "\nWould you like to calculate ratios for another stock? (yes/no): ",
                 type="acceptance",
             )
+            if new_calculation is QUIT:
+                return self.__leave_module__("ratio calculator")
 
             if not new_calculation:
                 self.selector = None
@@ -158,8 +199,7 @@ class Engine:
             self.selector = None
             print(f"Error occurred: {e}")
         except EOFError:
-            self.selector = None
-            print("Exiting ratio calculator.\n")
+            self.__leave_module__("ratio calculator")
 
     def run_portfolio_manager(self) -> None:
         """
@@ -167,25 +207,20 @@ class Engine:
         The user can either load a portfolio from a file or enter stocks manually.
         """
 
-        print("\n*****************************")
-        print("***** PORTFOLIO MANAGER *****")
-        print("*****************************\n")
-        print("You can either load a portfolio from a file or enter stocks manually.")
-        print("Enter 'quit' to exit the module.")
+        sys.stdout.write(PORTFOLIO_MANAGER_BANNER)
         try:
-            print("\nPlots will be saved under /portfolio_analysis folder.")
-            print(
-                "WARNING: If the folder exists, it will be deleted and recreated. Please save those files if you require there somewhere\n"
-            )
-
             save_report = self.input(
                 "Would you also like to save the portfolio analysis report? (yes/no): ",
                 type="acceptance",
             )
+            if save_report is QUIT:
+                return self.__leave_module__("portfolio manager")
 
             path = self.input(
                 "Enter the path to the portfolio JSON file\n(leave empty to enter stocks manually): "
             )
+            if path is QUIT:
+                return self.__leave_module__("portfolio manager")
 
             if path:
                 manager = PortfolioManager(path)
@@ -194,19 +229,32 @@ class Engine:
                 num_stocks = self.input(
                     "Enter the number of stocks in your portfolio: ", type="int"
                 )
+                if num_stocks is QUIT:
+                    return self.__leave_module__("portfolio manager")
+                rows = []
                 for i in range(num_stocks):
                     ticker = self.input(f"Enter ticker symbol for stock {i+1}: ")
+                    if ticker is QUIT:
+                        return self.__leave_module__("portfolio manager")
                     buy_date = self.input(
                         f"Enter buy date for {ticker} (YYYY-MM-DD): ", type="date"
                     )
+                    if buy_date is QUIT:
+                        return self.__leave_module__("portfolio manager")
                     buy_price = self.input(
                         f"Enter buy price for {ticker}: ", type="float"
                     )
+                    if buy_price is QUIT:
+                        return self.__leave_module__("portfolio manager")
                     quantity = self.input(
                         f"Enter quantity bought for {ticker}: ", type="int"
                     )
+                    if quantity is QUIT:
+                        return self.__leave_module__("portfolio manager")
+
+                    rows.append((ticker, buy_date, buy_price, quantity))
 
-                    manager.add_stock(ticker, buy_date, buy_price, quantity)
+                manager.add_stocks_bulk(rows)
 
             # Calculate portfolio performance
             portfolio_analysis = manager.calculate_portfolio_performance()
@@ -219,6 +267,8 @@ class Engine:
             print(recommendations)
             print("\n")
 
+            manager.wait_for_plots()
+
             if save_report:
                 manager.give_report()
                 print("--fyi reports are saved under /portfolio_analysis folder.")
@@ -227,6 +277,8 @@ class Engine:
                 "\nWould you like to analyze another portfolio? (yes/no): ",
                 type="acceptance",
             )
+            if new_analysis is QUIT:
+                return self.__leave_module__("portfolio manager")
 
             if not new_analysis:
                 self.selector = None
@@ -235,36 +287,32 @@ class Engine:
             self.selector = None
             print(f"Error occurred: {e}")
         except EOFError:
-            self.selector = None
-            print("Exiting portfolio manager.\n")
+            self.__leave_module__("portfolio manager")
 
-    def input(self, prompt, **kwargs) -> Any:
+    def input(self, prompt: str, type: str = "str", optional: bool = False) -> Any:
         """
         Take input from the user. Validate the input. Exit the engine if too many invalid attempts.
 
         Args:
             prompt (str): The prompt to display to the user.
-            **kwargs: Keyword arguments to pass to the validate_input function.
-            optional and type are two keyword arguments that can be passed to validate_input.
+            type (str, optional): The input type, see validations.get_validator. Defaults to "str".
+            optional (bool, optional): Whether the input can be left empty. Defaults to False.
 
         Returns:
-            Any: The validated input.
+            Any: The validated input, or QUIT if the user asked to leave the module.
         """
 
+        validator = get_validator(type)
         while True:
-            if self.invalid_attempts >= TOTAL_INVALID_ATTEMPTS:
-                print("Too many invalid attempts. Exiting the engine.")
-                sys.exit()
-
             input_value = input(prompt)
 
             if input_value == "quit":
-                raise EOFError
+                return QUIT
 
             if input_value == "exit":
                 self.__exit_engine__()
 
-            value, error = validate_input(input_value, **kwargs)
+            value, error = validator(input_value, optional)
 
             if not error:
                 return value
@@ -285,6 +333,12 @@ class Engine:
             self.__exit_engine__()
         print("\n")
 
+    def __leave_module__(self, module_name: str) -> None:
+        """Leave the current module and go back to module selection."""
+
+        self.selector = None
+        print(f"Exiting {module_name}.\n")
+
     def __exit_engine__(self) -> None:
         """Exit the engine."""
 
@@ -1,15 +1,23 @@
 import json as j
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-import shutil
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+# orjson is a faster drop-in for the report JSON; fall back to json without it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from cache import FileCache
 from yfinance_wrapper import YfinanceWrapper, TickerDataError
-from validations import validate_inputs
+from validations import validate_date
 
 
 class PorfolioJSONError(Exception):
@@ -20,15 +28,125 @@ class PorfolioJSONError(Exception):
         super().__init__(self.message)
 
 
+@dataclass
+class StockHolding:
+    """A stock held in the portfolio."""
+
+    __slots__ = ("buy_price", "quantity", "stock_data")
+
+    buy_price: float
+    quantity: int
+    stock_data: pd.DataFrame
+
+
+# Shared by every manager, so a new analysis reuses data fetched by earlier ones.
+STOCK_DATA_CACHE = FileCache()
+
+SMA_COLUMNS = [("10-day SMA", 10), ("50-day SMA", 50)]
+
+REPORT_FILE_PATTERNS = ("*.csv", "*.json", "*.png")
+
+REPORT_AVERAGE_COLUMNS = [
+    "Open",
+    "High",
+    "Low",
+    "Close",
+    "Adj Close",
+    "Volume",
+    "10-day SMA",
+    "50-day SMA",
+]
+
+
+def _validate_portfolio_row(
+    ticker: Any, details: Dict[str, Any]
+) -> Tuple[str, str, float, int]:
+    """Validate one stock entry of a portfolio JSON file.
+    The checks for the fixed portfolio schema are done inline rather than through the generic validate_inputs.
+    Args:
+        ticker (str): Stock ticker symbol.
+        details (dict): The buy_date, buy_price and quantity of the stock.
+    Returns:
+        tuple: The validated (ticker, buy_date, buy_price, quantity). Numeric values are returned unchanged.
+    Raises:
+        ValueError: If a field is missing or invalid."""
+    try:
+        buy_date = details["buy_date"]
+        buy_price = details["buy_price"]
+        quantity = details["quantity"]
+    except KeyError as key_error:
+        raise ValueError(f"Invalid JSON format. {key_error} not found for {ticker}.")
+
+    if not isinstance(ticker, str):
+        raise ValueError("Input: ticker; Invalid str format. Please try again.")
+    if not validate_date(buy_date):
+        raise ValueError("Input: buy_date; Invalid date format. Please try again.")
+    try:
+        converted_price = float(buy_price)
+    except (TypeError, ValueError):
+        raise ValueError("Input: buy_price; Invalid float format. Please try again.")
+    try:
+        converted_quantity = int(quantity)
+    except (TypeError, ValueError):
+        raise ValueError("Input: quantity; Invalid int format. Please try again.")
+
+    # Numbers are used as written in the JSON, so a quantity of 2.5 is not truncated to 2.
+    # Only numeric strings are replaced by their converted value.
+    if not isinstance(buy_price, (int, float)):
+        buy_price = converted_price
+    if not isinstance(quantity, (int, float)):
+        quantity = converted_quantity
+
+    return ticker, buy_date, buy_price, quantity
+
+
+def _sma_tail(prices: np.ndarray, window_size: int) -> float:
+    """Average of the last window_size prices, i.e. the latest simple moving average.
+    Args:
+        prices (ndarray): Stock prices as a float64 array.
+        window_size (int): Number of days to consider for the moving average.
+    Returns:
+        float: The latest simple moving average."""
+    return float(prices[-window_size:].mean())
+
+
+def _full_sma(prices: np.ndarray, window_size: int) -> np.ndarray:
+    """Simple moving average for every day, computed from a running sum in O(N).
+    The first window_size - 1 days have no full window and are NaN, like pandas' rolling().mean().
+    Args:
+        prices (ndarray): Stock prices as a float64 array.
+        window_size (int): Number of days to consider for the moving average.
+    Returns:
+        ndarray: The simple moving averages, aligned with prices."""
+    sma = np.full(prices.shape[0], np.nan)
+    if prices.shape[0] < window_size:
+        return sma
+
+    # A missing price would poison every later running sum, let pandas skip over it
+    if np.isnan(prices).any():
+        return pd.Series(prices).rolling(window=window_size).mean().to_numpy()
+
+    cumulative = np.empty(prices.shape[0] + 1)
+    cumulative[0] = 0.0
+    np.cumsum(prices, out=cumulative[1:])
+    sma[window_size - 1 :] = (
+        cumulative[window_size:] - cumulative[:-window_size]
+    ) / window_size
+    return sma
+
+
 class PortfolioManager:
     def __init__(
         self,
         path: Optional[str] = None,
         out_path: Path = Path("portfolio_analysis"),
+        clean: bool = False,
     ):
         """Initialize the Portfolio Manager.
         Args:
             path (str, optional): Path to the JSON file containing the portfolio data. Defaults to None.
+            out_path (Path, optional): Directory the plots and reports are saved to. Defaults to Path("portfolio_analysis").
+            clean (bool, optional): Delete the plots and reports already in out_path. Defaults to False.
         Raises:
             ValueError: If the JSON data is not in the correct format.
 
@@ -51,17 +169,24 @@ class PortfolioManager:
         """
         self.portfolio = {}
         self.yf_wrapper = YfinanceWrapper()
+        self.cache = STOCK_DATA_CACHE
+        self.plot_futures = []
+        # Today's date string, shared by every fetch until the day rolls over
+        self.today = datetime.now().date()
+        self.today_str = self.today.strftime("%Y-%m-%d")
 
         self.out_path = out_path
-        # Delete the existing directory and create a new one
-        if os.path.exists(self.out_path):
-            shutil.rmtree(self.out_path, ignore_errors=True)
-
         os.makedirs(self.out_path, exist_ok=True)
         # check if out_path is a valid path and not a file
         if not self.out_path.is_dir():
             raise ValueError("Invalid output path. Please provide a directory path.")
 
+        if clean:
+            # Only remove the files this class writes, not the whole directory
+            for pattern in REPORT_FILE_PATTERNS:
+                for report_file in self.out_path.glob(pattern):
+                    report_file.unlink()
+
         if path:
             self.path = path
             self.__get_json_data()
@@ -72,6 +197,10 @@ class PortfolioManager:
 
     def __read_json__(self, file_path):
         """Read JSON data from a file."""
+        if orjson is not None:
+            with open(file_path, "rb") as file:
+                return orjson.loads(file.read())
+
         with open(file_path, "r") as file:
             return j.load(file)
 
@@ -94,18 +223,13 @@ class PortfolioManager:
                     "Invalid JSON format. 'portfolio' should be a k/v pair. Check Documentation."
                 )
 
-            for stock, details in data["portfolio"].items():
-                ticker = stock
-                buy_date = details["buy_date"]
-                buy_price = details["buy_price"]
-                quantity = details["quantity"]
-                validate_inputs(
-                    ("ticker", ticker, {"type": "str"}),
-                    ("buy_date", buy_date, {"type": "date"}),
-                    ("buy_price", buy_price, {"type": "float"}),
-                    ("quantity", quantity, {"type": "int"}),
-                )
-                self.add_stock(ticker, buy_date, buy_price, quantity)
+            rows = [
+                _validate_portfolio_row(stock, details)
+                for stock, details in data["portfolio"].items()
+            ]
+
+            # Fetch all the tickers at once rather than one after the other
+            self.add_stocks_bulk(rows)
 
             print("Portfolio loaded successfully.")
 
@@ -128,6 +252,8 @@ class PortfolioManager:
             ValueError: If the portfolio performance or recommendations are not calculated.
         """
 
+        self.wait_for_plots()
+
         try:
             if not self.portfolio_performance or not self.recommendations:
                 raise ValueError(
@@ -143,53 +269,54 @@ class PortfolioManager:
         }
 
         for stock, details in data["portfolio"].items():
-            # Save stock data to a CSV file
-            stock_data = details["stock_data"]
-            stock_data.to_csv(
-                f"{self.out_path}/{stock}.csv", index=False, header=True, sep=","
-            )
-            averages = {
-                "Open_avg": stock_data["Open"].mean(),
-                "High_avg": stock_data["High"].mean(),
-                "Low_avg": stock_data["Low"].mean(),
-                "Close_avg": stock_data["Close"].mean(),
-                "Adj_Close_avg": stock_data["Adj Close"].mean(),
-                "Volume_avg": stock_data["Volume"].mean(),
-                "10-day_SMA_avg": stock_data["10-day SMA"].mean(),
-                "50-day_SMA_avg": stock_data["50-day SMA"].mean(),
-            }
+            # The stock data goes to its own CSV file instead of the report
+            stock_data = details.pop("stock_data")
+            stock_data.to_csv(f"{self.out_path}/{stock}.csv", index=False)
+            # Average every reported column in a single pass over the frame
+            means = stock_data[REPORT_AVERAGE_COLUMNS].mean()
 
             # Add averages to details dictionary
-            details.update(averages)
-            details.pop("stock_data", None)
+            details.update(
+                (f"{column.replace(' ', '_')}_avg", float(mean))
+                for column, mean in means.items()
+            )
 
         self.__write_json__(file_path=f"{self.out_path}/{report_name}.json", data=data)
 
+    def wait_for_plots(self):
+        """Wait until the plots started by calculate_portfolio_performance are saved.
+        Raises:
+            Exception: Any error raised while drawing a plot.
+        """
+        plot_futures, self.plot_futures = self.plot_futures, []
+        for future in plot_futures:
+            future.result()
+
     def __write_json__(self, file_path, data):
         """Write JSON data to a file.
         Args:
             file_path (str): Path to the file to write the JSON data to.
             data (dict): The data to write to the file.
         """
+        if orjson is not None:
+            with open(file_path, "wb") as file:
+                file.write(
+                    orjson.dumps(
+                        data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                    )
+                )
+            return
+
         with open(file_path, "w") as file:
             j.dump(data, file, indent=4)
 
-    def get_stock_data(self, ticker: str, start_date: str):
-        """Fetch historical stock data from Yahoo Finance.
-        Args:
-            ticker (str): Stock ticker symbol.
-            start_date (str): Start date for fetching historical data.
-        Returns:
-            DataFrame: Stock data.
-        """
-        stock_data = self.yf_wrapper.get_data(
-            ticker, start_date, datetime.now().date().strftime("%Y-%m-%d")
-        )
-        if stock_data is None or stock_data.empty:
-            raise TickerDataError(
-                f"Stock data not found for {ticker}. Please try again."
-            )
-        return stock_data
+    def __today_str__(self) -> str:
+        """Get today's date as YYYY-MM-DD, formatting it again only after the day changes."""
+        today = datetime.now().date()
+        if today != self.today:
+            self.today = today
+            self.today_str = today.strftime("%Y-%m-%d")
+        return self.today_str
 
     def add_stock(self, ticker, buy_date, buy_price, quantity):
         """Add a stock to the portfolio.
@@ -199,12 +326,52 @@ class PortfolioManager:
             buy_price (float): Price at which the stock was bought.
             quantity (int): Quantity of the stock bought.
         """
-        stock_data = self.get_stock_data(ticker, buy_date)
-        self.portfolio[ticker] = {
-            "buy_price": buy_price,
-            "quantity": quantity,
-            "stock_data": stock_data,
-        }
+        self.add_stocks_bulk([(ticker, buy_date, buy_price, quantity)])
+
+    def add_stocks_bulk(self, rows: List[Tuple[str, str, float, int]]):
+        """Add several stocks to the portfolio, downloading the uncached data in one request.
+        Args:
+            rows (list): List of (ticker, buy_date, buy_price, quantity) tuples.
+        Raises:
+            TickerDataError: If the data for any of the tickers could not be fetched.
+        """
+        if not rows:
+            return
+
+        end_date = self.__today_str__()
+        stock_data_list = [
+            self.cache.get(ticker, buy_date, end_date)
+            for ticker, buy_date, _, _ in rows
+        ]
+
+        # Everything that is not cached is fetched in a single download from the earliest
+        # buy date, then each stock's data is cut down to its own buy date.
+        missing = [
+            i for i, stock_data in enumerate(stock_data_list) if stock_data is None
+        ]
+        if missing:
+            start_date = min(rows[i][1] for i in missing)
+            downloaded = self.yf_wrapper.get_data_many(
+                [rows[i][0] for i in missing], start_date, end_date
+            )
+            if downloaded is None:
+                downloaded = {}
+
+            for i in missing:
+                ticker, buy_date, _, _ = rows[i]
+                stock_data = downloaded.get(ticker)
+                if stock_data is not None:
+                    stock_data = stock_data.loc[buy_date:]
+                if stock_data is None or stock_data.empty:
+                    raise TickerDataError(
+                        f"Stock data not found for {ticker}. Please try again."
+                    )
+                self.cache.set(ticker, buy_date, end_date, stock_data)
+                stock_data_list[i] = stock_data.copy()
+
+        for (ticker, _, buy_price, quantity), stock_data in zip(rows, stock_data_list):
+            self.__ensure_smas__(stock_data)
+            self.portfolio[ticker] = StockHolding(buy_price, quantity, stock_data)
 
     def calculate_portfolio_performance(self) -> Dict[str, Any]:
         """Calculate the performance of the portfolio.
@@ -212,25 +379,41 @@ class PortfolioManager:
             dict: Portfolio analysis.
         """
         portfolio_analysis = {"portfolio": {}}
-        total_investment = 0
-        total_value = 0
-        for stock, data in self.portfolio.items():
-            buy_price = data["buy_price"]
-            quantity = data["quantity"]
-            stock_data = data["stock_data"]
-            current_price = stock_data["Close"].tolist()[-1]
-            total_investment += buy_price * quantity
-            total_value += current_price * quantity
-            # Calculate profit/loss
-            profit_loss = (current_price - buy_price) * quantity
+        stocks = list(self.portfolio)
+        holdings = list(self.portfolio.values())
+        buy_prices = np.array([holding.buy_price for holding in holdings], dtype=float)
+        quantities = np.array([holding.quantity for holding in holdings], dtype=float)
+        current_prices = np.array(
+            [holding.stock_data["Close"].iat[-1] for holding in holdings], dtype=float
+        )
+
+        total_investment = float((buy_prices * quantities).sum())
+        total_value = float((current_prices * quantities).sum())
+        # Calculate profit/loss
+        profits_losses = (current_prices - buy_prices) * quantities
+
+        for stock, holding, current_price, profit_loss in zip(
+            stocks, holdings, current_prices, profits_losses
+        ):
             portfolio_analysis["portfolio"][stock] = {
-                "Buy Price": buy_price,
-                "Current Price": current_price,
-                "Quantity": quantity,
-                "Profit/Loss": profit_loss,
-                "stock_data": stock_data,
+                "Buy Price": holding.buy_price,
+                "Current Price": float(current_price),
+                "Quantity": holding.quantity,
+                "Profit/Loss": float(profit_loss),
+                "stock_data": holding.stock_data,
             }
-            self.plot_stock_with_moving_averages(stock_data, stock)
+
+        # Draw the plots in the background while the analysis carries on.
+        # A single worker keeps matplotlib on one thread at a time.
+        plot_executor = ThreadPoolExecutor(max_workers=1)
+        for stock, holding in self.portfolio.items():
+            self.__ensure_smas__(holding.stock_data)
+            self.plot_futures.append(
+                plot_executor.submit(
+                    self.plot_stock_with_moving_averages, holding.stock_data, stock
+                )
+            )
+        plot_executor.shutdown(wait=False)
 
         portfolio_analysis["Total"] = {
             "Total Investment": total_investment,
@@ -241,18 +424,14 @@ class PortfolioManager:
         self.portfolio_performance = portfolio_analysis
         return portfolio_analysis
 
-    def calculate_simple_moving_average(self, prices: List, window_size: int) -> float:
+    def calculate_simple_moving_average(self, prices, window_size: int) -> float:
         """Calculate the simple moving average of a stock. The window size is the number of days to consider.
         Args:
-            prices (list): List of stock prices.
+            prices (Series | ndarray | list): Stock prices.
             window_size (int): Number of days to consider for the moving average.
         Returns:
             float: The simple moving average."""
-        sma = [
-            sum(prices[i : i + window_size]) / window_size
-            for i in range(len(prices) - window_size + 1)
-        ]
-        return sma[-1]
+        return _sma_tail(np.asarray(prices, dtype=np.float64), window_size)
 
     def generate_recommendation(self, portfolio_analysis: Dict) -> Dict[str, str]:
         """Generate recommendations for the stocks in the portfolio based on a decision rule.
@@ -280,17 +459,23 @@ class PortfolioManager:
             buy_price (float): Price at which the stock was bought.
         Returns:
             str: Recommendation to Buy, Sell, or Hold."""
-        # Get recent close prices
-        close_prices = stock_data["Close"].tolist()
-        current_price = close_prices[-1]
-
-        # Calculate simple moving averages
-        if len(close_prices) > 50:
-            short_sma = self.calculate_simple_moving_average(close_prices, 10)
-            long_sma = self.calculate_simple_moving_average(close_prices, 50)
-        else:
+        # Get recent close prices as a view on the frame's data
+        close_prices = stock_data["Close"].to_numpy()
+        if close_prices.shape[0] <= 50:
             return "Hold"
 
+        current_price = float(close_prices[-1])
+
+        # Moving averages are computed once per stock and shared with the plot
+        if "10-day SMA" in stock_data and "50-day SMA" in stock_data:
+            short_sma = stock_data["10-day SMA"].iat[-1]
+            long_sma = stock_data["50-day SMA"].iat[-1]
+        else:
+            # Only the latest averages are needed, both come from the last 50 days
+            tail = close_prices[-50:]
+            long_sma = _sma_tail(tail, 50)
+            short_sma = _sma_tail(tail, 10)
+
         if short_sma > long_sma and current_price > buy_price:
             # Buy is risky - buying more at a price significantly higher than your initial buy price
             # could increase your risk if the market adjusts or if the stock is currently overvalued
@@ -307,32 +492,53 @@ class PortfolioManager:
         else:
             return "Hold"
 
+    def __ensure_smas__(self, stock_data: pd.DataFrame):
+        """Add the 10-day and 50-day simple moving average columns if they are missing.
+        Args:
+            stock_data (DataFrame): Stock data."""
+        missing = [
+            (column, window)
+            for column, window in SMA_COLUMNS
+            if column not in stock_data
+        ]
+        if not missing:
+            return
+
+        close_prices = stock_data["Close"].to_numpy(dtype=np.float64)
+        # Insert the columns together rather than growing the frame one at a time
+        stock_data[[column for column, _ in missing]] = np.column_stack(
+            [_full_sma(close_prices, window) for _, window in missing]
+        )
+
     def plot_stock_with_moving_averages(self, stock_data: pd.DataFrame, ticker: str):
         """Plot the stock prices with 10-day and 50-day simple moving averages.
         Args:
             stock_data (DataFrame): Stock data.
             ticker (str): Stock ticker symbol."""
 
-        # Calculate moving averages
-        stock_data["10-day SMA"] = stock_data["Close"].rolling(window=10).mean()
-        stock_data["50-day SMA"] = stock_data["Close"].rolling(window=50).mean()
+        self.__ensure_smas__(stock_data)
+
+        # Imported here so matplotlib is only loaded when a plot is drawn.
+        # A bare Figure renders with Agg and keeps no pyplot global state,
+        # which lets plots be drawn off the main thread.
+        from matplotlib.figure import Figure
 
         # Create the plot
-        plt.figure(figsize=(12, 6))
-        plt.plot(stock_data["Close"], label=f"{ticker} Close Prices", color="blue")
-        plt.plot(stock_data["10-day SMA"], label="10-day SMA", color="green")
-        plt.plot(stock_data["50-day SMA"], label="50-day SMA", color="red")
+        figure = Figure(figsize=(12, 6))
+        axes = figure.subplots()
+        axes.plot(stock_data["Close"], label=f"{ticker} Close Prices", color="blue")
+        axes.plot(stock_data["10-day SMA"], label="10-day SMA", color="green")
+        axes.plot(stock_data["50-day SMA"], label="50-day SMA", color="red")
 
         # Adding labels and title
-        plt.title(f"{ticker} Stock Prices and Moving Averages")
-        plt.xlabel("Date")
-        plt.ylabel("Price")
-        plt.legend()
-        plt.grid(True)
+        axes.set_title(f"{ticker} Stock Prices and Moving Averages")
+        axes.set_xlabel("Date")
+        axes.set_ylabel("Price")
+        axes.legend()
+        axes.grid(True)
 
         filename = f"{ticker}_moving_averages_plot.png"
-        plt.savefig(os.path.join(self.out_path, filename))
-        plt.close()
+        figure.savefig(os.path.join(self.out_path, filename))
 
 
 def main():
@@ -350,8 +556,13 @@ def main():
 
     # Display portfolio analysis with recommendations
     print("\nPortfolio Analysis with Recommendations:")
-    df = pd.DataFrame.from_dict(portfolio_analysis["portfolio"], orient="index")
-    df["Recommendation"] = [recommendations[stock] for stock in df.index]
+    # Leave out the per-stock DataFrames so pandas does not build object cells for them
+    summary = {
+        stock: {key: value for key, value in details.items() if key != "stock_data"}
+        for stock, details in portfolio_analysis["portfolio"].items()
+    }
+    df = pd.DataFrame.from_dict(summary, orient="index")
+    df["Recommendation"] = df.index.map(recommendations)
     print(df)
 
 
@@ -1,3 +1,5 @@
+import numpy as np
+
 from yfinance_wrapper import YfinanceWrapper, TickerDataError
 
 
@@ -25,6 +27,14 @@ class RatioCalculator:
                 f"Stock data not found for {ticker}. Please try again."
             )
 
+        # The price columns are read by every calculation and never modified,
+        # so look them up and convert them to NumPy arrays only once.
+        self.ohlc = self.ticker_data[["Open", "High", "Low", "Close"]].to_numpy()
+        self.open_prices = self.ticker_data["Open"].to_numpy()
+        self.high_prices = self.ticker_data["High"].to_numpy()
+        self.low_prices = self.ticker_data["Low"].to_numpy()
+        self.close_prices = self.ticker_data["Close"].to_numpy()
+
     # Calculate price-to-earnings ratio
     def calculate_pe_ratio(self):
         """
@@ -37,15 +47,12 @@ class RatioCalculator:
             >>> ratio_calculator = RatioCalculator("AAPL", "2021-01-01", "2021-12-31")
             >>> print(ratio_calculator.calculate_pe_ratio())
         """
-        avg_price = (
-            self.ticker_data["Open"]
-            + self.ticker_data["High"]
-            + self.ticker_data["Low"]
-            + self.ticker_data["Close"]
-        ) / 4
-        self.ticker_data["PE Ratio"] = avg_price / (
-            self.ticker_data["Close"] - self.ticker_data["Open"]
-        )
+        avg_price = self.ohlc.mean(axis=1)
+        book_price = self.close_prices - self.open_prices
+        # Days that close at their open have no ratio, leave them as NaN instead of inf
+        pe_ratio = np.full_like(avg_price, np.nan)
+        np.divide(avg_price, book_price, out=pe_ratio, where=book_price != 0)
+        self.ticker_data["PE Ratio"] = pe_ratio
         return self.ticker_data
 
     # Calculate Price Change percentage
@@ -60,10 +67,8 @@ class RatioCalculator:
             >>> ratio_calculator = RatioCalculator("AAPL", "2021-01-01", "2021-12-31")
             >>> print(ratio_calculator.calculate_pc_percent())
         """
-        book_price = self.ticker_data["Close"] - self.ticker_data["Open"]
-        self.ticker_data["Price Change Percentage"] = (
-            book_price / self.ticker_data["Open"]
-        )
+        book_price = self.close_prices - self.open_prices
+        self.ticker_data["Price Change Percentage"] = book_price / self.open_prices
         return self.ticker_data
 
     # Calculate volume-weighted average price
@@ -78,16 +83,9 @@ class RatioCalculator:
             >>> ratio_calculator = RatioCalculator("AAPL", "2021-01-01", "2021-12-31")
             >>> print(ratio_calculator.calculate_vwap())
         """
-        avg_price = (
-            self.ticker_data["Open"]
-            + self.ticker_data["High"]
-            + self.ticker_data["Low"]
-            + self.ticker_data["Close"]
-        ) / 4
-        vwap = sum(avg_price * self.ticker_data["Volume"]) / sum(
-            self.ticker_data["Volume"]
-        )
-        return vwap
+        avg_price = self.ohlc.mean(axis=1)
+        volume = self.ticker_data["Volume"].to_numpy(dtype=np.float64)
+        return float(np.dot(avg_price, volume) / volume.sum())
 
     # Calculate Relative Strength Index
     def calculate_rsi(self):
@@ -101,18 +99,15 @@ class RatioCalculator:
             >>> ratio_calculator = RatioCalculator("AAPL", "2021-01-01", "2021-12-31")
             >>> print(ratio_calculator.calculate_rsi())
         """
-        self.ticker_data["price_diff"] = (
-            self.ticker_data["Close"] - self.ticker_data["Open"]
-        )
-        up_closes = []
-        down_closes = []
-        for index, row in self.ticker_data.iterrows():
-            if row["price_diff"] > 0:
-                up_closes.append(row["Close"])
-            else:
-                down_closes.append(row["Close"])
-        avg_up_close = sum(up_closes) / len(up_closes)
-        avg_down_close = sum(down_closes) / len(down_closes)
+        close = self.close_prices
+        # Days that closed above their open count as up closes (1), the rest as down closes (0).
+        # bincount sums and counts both groups in one pass each: [down, up].
+        up_days = (close - self.open_prices > 0).astype(np.intp)
+        totals = np.bincount(up_days, weights=close, minlength=2)
+        counts = np.bincount(up_days, minlength=2)
+        # A group with no days averages to NaN, like the mean of an empty selection
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg_down_close, avg_up_close = totals / counts
         relative_strength = avg_up_close / avg_down_close
         return 100 - (100 / (1 + relative_strength))
 
@@ -128,22 +123,23 @@ class RatioCalculator:
             >>> ratio_calculator = RatioCalculator("AAPL", "2021-01-01", "2021-12-31")
             >>> print(ratio_calculator.calculate_atr())
         """
-        self.ticker_data["ATR"] = 0.0
-        prev_close = None
-        for i in self.ticker_data.index:
-            if prev_close is None:
-                self.ticker_data.loc[i, 'ATR'] = (
-                    self.ticker_data["High"][i] - self.ticker_data["Low"][i]
-                )
-                prev_close = self.ticker_data["Close"][i]
-                continue
-
-            self.ticker_data.loc[i, 'ATR'] = max(
-                self.ticker_data["High"][i] - self.ticker_data["Low"][i],
-                abs(self.ticker_data["High"][i] - prev_close),
-                abs(self.ticker_data["Low"][i] - prev_close),
-            )
-            prev_close = self.ticker_data["Close"][i]
+        high = self.high_prices
+        low = self.low_prices
+        close = self.close_prices
+
+        # Each day's range is compared against the previous close
+        prev_close = np.empty_like(close)
+        prev_close[:1] = close[:1]
+        prev_close[1:] = close[:-1]
+        high_low = high - low
+        true_range = np.maximum(
+            high_low,
+            np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)),
+        )
+        # The first day has no previous close, only its own range counts
+        true_range[:1] = high_low[:1]
+
+        self.ticker_data["ATR"] = true_range
         return self.ticker_data
 
     # Calculate Everything
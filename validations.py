@@ -1,5 +1,12 @@
-from datetime import datetime
-from typing import Any, Tuple, Optional, Dict
+from datetime import date as date_type, datetime
+from functools import lru_cache, partial
+import re
+from typing import Any, Callable, Tuple, Optional, Dict, Union
+
+
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}\Z")
+
+_REJECTION_TOKENS = frozenset({"no", "n"})
 
 
 def validate_inputs(*inputs: Tuple[str, Any, Dict[str, Any]]) -> list:
@@ -30,7 +37,13 @@ def validate_inputs(*inputs: Tuple[str, Any, Dict[str, Any]]) -> list:
     validated_inputs = list()
     for current_input in inputs:
         name, value, argsDict = current_input
-        validated_input = validate_and_sanitize_input(name, value, **argsDict)
+        # Same as validate_and_sanitize_input, without rebuilding the arguments as kwargs
+        validator = _make_validator(
+            argsDict.get("type", "str"), argsDict.get("optional", False)
+        )
+        validated_input, error = validator(value)
+        if error:
+            raise ValueError(f"Input: {name}; ", error)
         validated_inputs.append(validated_input)
 
     return validated_inputs
@@ -122,28 +135,93 @@ def validate_input(value, **kwargs) -> Tuple[Any, Optional[str]]:
         (None, None)
     """
 
-    type = kwargs.get("type", "str")
-    optional = kwargs.get("optional", False)
+    validator = _make_validator(
+        kwargs.get("type", "str"), kwargs.get("optional", False)
+    )
+    return validator(value)
+
+
+def get_validator(
+    input_type: str,
+) -> Callable[[Any, bool], Tuple[Any, Optional[str]]]:
+    """
+    Get the validator for an input type.
+    Callers that validate many values of the same type can look the validator up once and call it directly.
+
+    Args:
+        input_type (str): The input type. One of str, int, float, date or acceptance. Unknown types are treated as str.
+
+    Returns:
+        Callable: A function taking the value and whether it is optional, returning the same tuple as validate_input.
+
+    Examples:
+        >>> validate_int = get_validator("int")
+        >>> validate_int("10", False)
+        (10, None)
+        >>> validate_int("", True)
+        (None, None)
+    """
+    return _VALIDATORS.get(input_type, _validate_str)
+
+
+@lru_cache(maxsize=16)
+def _make_validator(
+    input_type: str, optional: bool
+) -> Callable[[Any], Tuple[Any, Optional[str]]]:
+    """Build a validator taking only the value, cached for each input type and optional flag."""
+    return partial(get_validator(input_type), optional=optional)
+
+
+def _validate_str(value, optional: bool = False) -> Tuple[Any, Optional[str]]:
+    """Validate a str input."""
+    if optional and not value:
+        return (None, None)
+    return (value, None)
+
+
+def _validate_int(value, optional: bool = False) -> Tuple[Any, Optional[str]]:
+    """Validate an int input."""
+    if optional and not value:
+        return (None, None)
+    try:
+        return (int(value), None)
+    except ValueError:
+        return (None, "Invalid int format. Please try again.")
+
 
+def _validate_float(value, optional: bool = False) -> Tuple[Any, Optional[str]]:
+    """Validate a float input."""
+    if optional and not value:
+        return (None, None)
     try:
-        if optional and not value:
-            return (None, None)
-
-        if type == "float":
-            return (float(value), None)
-        elif type == "int":
-            return (int(value), None)
-        elif type == "date":
-            if validate_date(value):
-                return (value, None)
-            else:
-                return (None, "Invalid date format. Please try again.")
-        elif type == "acceptance":
-            return (validate_input_acceptance(value), None)
-        else:
-            return (value, None)
+        return (float(value), None)
     except ValueError:
-        return (None, f"Invalid {type} format. Please try again.")
+        return (None, "Invalid float format. Please try again.")
+
+
+def _validate_date(value, optional: bool = False) -> Tuple[Any, Optional[str]]:
+    """Validate a date input."""
+    if optional and not value:
+        return (None, None)
+    if validate_date(value):
+        return (value, None)
+    return (None, "Invalid date format. Please try again.")
+
+
+def _validate_acceptance(value, optional: bool = False) -> Tuple[Any, Optional[str]]:
+    """Validate a yes/no input."""
+    if optional and not value:
+        return (None, None)
+    return (validate_input_acceptance(value), None)
+
+
+_VALIDATORS = {
+    "str": _validate_str,
+    "int": _validate_int,
+    "float": _validate_float,
+    "date": _validate_date,
+    "acceptance": _validate_acceptance,
+}
 
 
 def validate_date(date) -> bool:
@@ -163,25 +241,59 @@ def validate_date(date) -> bool:
         False
     """
 
+    if not isinstance(date, str):
+        return False
+    return _is_iso_date(date)
+
+
+@lru_cache(maxsize=4096)
+def _is_iso_date(date: str) -> bool:
+    """Check a YYYY-MM-DD string. The same few dates are validated over and over, so results are cached."""
+    if not _DATE_RE.match(date):
+        return False
+
     try:
-        datetime.strptime(date, "%Y-%m-%d")
+        date_type.fromisoformat(date)
         return True
     except ValueError:
         return False
 
 
+def parse_date(date: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD date.
+
+    Args:
+        date (str): The date to parse.
+
+    Returns:
+        datetime: The parsed date.
+
+    Raises:
+        ValueError: If the date is not in the YYYY-MM-DD format or does not exist.
+
+    Examples:
+        >>> parse_date("2021-01-01")
+        datetime.datetime(2021, 1, 1, 0, 0)
+    """
+    # The format is fixed, so read the fields directly instead of going through strptime
+    if not _DATE_RE.match(date):
+        raise ValueError(f"time data {date!r} does not match format '%Y-%m-%d'")
+    return datetime(int(date[0:4]), int(date[5:7]), int(date[8:10]))
+
+
 def validate_min_max_date(
-    date: str,
+    date: Union[str, datetime],
     min_date: datetime = datetime(1970, 1, 1),
-    max_date: datetime = datetime.now(),
+    max_date: Optional[datetime] = None,
 ) -> Tuple[bool, Optional[str]]:
     """
     Validate that the date is not before 1970-01-01 or after max_Date.
 
     Args:
-        date (str): The date to validate.
+        date (str | datetime): The date to validate, as YYYY-MM-DD or an already parsed datetime.
         min_date (datetime): The minimum date allowed.
-        max_date (datetime): The maximum date allowed.
+        max_date (datetime, optional): The maximum date allowed. Defaults to now.
 
     Returns:
         bool: True if the date is not before 1970-01-01, False otherwise.
@@ -197,7 +309,11 @@ def validate_min_max_date(
         >>> validate_max_date("2022-01-01")
         (False, 'Date cannot be after 2021-01-01. Please try again.')
     """
-    formatted_date = datetime.strptime(date, "%Y-%m-%d")
+    # Callers that already parsed the date pass the datetime so it is not parsed twice
+    formatted_date = date if isinstance(date, datetime) else parse_date(date)
+    # Read the clock on every call, a datetime.now() default would be frozen at import time
+    if max_date is None:
+        max_date = datetime.now()
     if formatted_date < min_date:
         return (False, "Date cannot be before 1970-01-01. Please try again.")
     if formatted_date > max_date:
@@ -217,6 +333,4 @@ def validate_input_acceptance(ip: str) -> bool:
     Returns:
         bool: True if the user input is accepted, False otherwise.
     """
-    if ip.lower() == "no" or ip.lower() == "n":
-        return False
-    return True
+    return ip.strip().lower() not in _REJECTION_TOKENS
@@ -1,8 +1,15 @@
-import yfinance as yf
 import pandas as pd
 from validations import validate_inputs
 
-from typing import Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+
+# Number of ticker histories kept in memory, least recently used ones are dropped first.
+MAX_CACHED_HISTORIES = 32
+
+# Histories fetched in this process, keyed by ticker, start and end.
+HISTORY_CACHE: "OrderedDict[Tuple[str, str, str], pd.DataFrame]" = OrderedDict()
 
 
 class TickerDataError(Exception):
@@ -13,13 +20,22 @@ class TickerDataError(Exception):
         super().__init__(self.message)
 
 
+def _yfinance():
+    """Import yfinance on first use. It pulls in a long chain of dependencies that importing this module should not pay for."""
+    import yfinance
+
+    return yfinance
+
+
 class YfinanceWrapper:
     """
     Wrapper class for Yahoo Finance API.
 
     Functions:
         get_data: Fetch historical stock data from Yahoo Finance.
-        history: Fetch historical stock data from Yahoo Finance.
+        get_data_many: Fetch historical stock data for several tickers in one download.
+        history: Fetch historical stock data from Yahoo Finance. Histories are kept in memory.
+        clear_cache: Forget the histories kept in memory.
     """
 
     def get_data(self, ticker: str, start: str, end: str) -> Optional[pd.DataFrame]:
@@ -45,7 +61,7 @@ class YfinanceWrapper:
                 ("end", end, {"type": "date"}),
             )
 
-            return yf.download(ticker, start=start, end=end)
+            return _yfinance().download(ticker, start=start, end=end)
         except ValueError as e:
             print(f"Value Error occurred: {e}")
             return None
@@ -53,6 +69,67 @@ class YfinanceWrapper:
             print(f"Error occurred: {e}")
             return None
 
+    def get_data_many(
+        self, tickers: List[str], start: str, end: str
+    ) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Fetch historical stock data for several tickers in one download.
+        yfinance fetches the tickers on its own threads, so this is much faster than calling get_data for each.
+
+        Args:
+            tickers (list): The stock ticker symbols.
+            start (str): The start date for fetching historical data.
+            end (str): The end date for fetching historical data.
+
+        Returns:
+            dict: The historical stock data of each ticker, keyed as passed in. Tickers without data are left out.
+
+        Examples:
+            >>> data = YfinanceWrapper().get_data_many(["AAPL", "GOOGL"], "2021-01-01", "2021-12-31")
+            >>> print(data["AAPL"])
+        """
+        try:
+            *tickers, start, end = validate_inputs(
+                *(("ticker", ticker, {"type": "str"}) for ticker in tickers),
+                ("start", start, {"type": "date"}),
+                ("end", end, {"type": "date"}),
+            )
+            # yfinance upper-cases the symbols, so "aapl" and "AAPL" are one download
+            symbols = list(dict.fromkeys(ticker.upper() for ticker in tickers))
+            data = _yfinance().download(
+                " ".join(symbols), start=start, end=end, group_by="ticker", threads=True
+            )
+        except ValueError as e:
+            print(f"Value Error occurred: {e}")
+            return None
+        except Exception as e:
+            print(f"Error occurred: {e}")
+            return None
+
+        # A single symbol comes back without the ticker level in the columns
+        if not isinstance(data.columns, pd.MultiIndex):
+            frames = {symbols[0]: data}
+        else:
+            downloaded = set(data.columns.get_level_values(0))
+            frames = {
+                symbol: data[symbol] for symbol in symbols if symbol in downloaded
+            }
+
+        symbol_data = {}
+        for symbol, stock_data in frames.items():
+            # Tickers with a shorter history are padded with empty rows
+            stock_data = stock_data.dropna(how="all")
+            if not stock_data.empty:
+                symbol_data[symbol] = stock_data
+
+        # Hand the data back under the tickers as the caller spelled them
+        ticker_data = {}
+        for ticker in tickers:
+            stock_data = symbol_data.get(ticker.upper())
+            if stock_data is not None:
+                ticker_data[ticker] = stock_data
+        return ticker_data
+
     def history(self, ticker: str, start: str, end: str) -> Optional[pd.DataFrame]:
         """
         Fetch historical stock data from Yahoo Finance.
@@ -63,7 +140,7 @@ class YfinanceWrapper:
             end (str): The end date for fetching historical data.
 
         Returns:
-            pd.DataFrame: The historical stock data.
+            pd.DataFrame: The historical stock data. Repeated calls for the same ticker and dates return a copy of the first download.
 
         Examples:
             >>> data = YfinanceWrapper().history("AAPL", "2021-01-01", "2021-12-31")
@@ -76,10 +153,35 @@ class YfinanceWrapper:
                 ("end", end, {"type": "date"}),
             )
 
-            return yf.Ticker(ticker).history(ticker, start=start, end=end)
+            key = (ticker, start, end)
+            ticker_data = HISTORY_CACHE.get(key)
+            if ticker_data is None:
+                ticker_data = (
+                    _yfinance().Ticker(ticker).history(ticker, start=start, end=end)
+                )
+                # Failed fetches come back empty, leave them out so the next call retries
+                if ticker_data is None or ticker_data.empty:
+                    return ticker_data
+                HISTORY_CACHE[key] = ticker_data
+                while len(HISTORY_CACHE) > MAX_CACHED_HISTORIES:
+                    HISTORY_CACHE.popitem(last=False)
+            HISTORY_CACHE.move_to_end(key)
+
+            # Callers add their own columns to the frame, each one gets a copy
+            return ticker_data.copy()
         except ValueError as e:
             print(f"Value Error occurred: {e}")
             return None
         except Exception as e:
             print(f"Error occurred: {e}")
             return None
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Forget the histories kept in memory, so the next calls fetch fresh data.
+
+        Examples:
+            >>> YfinanceWrapper.clear_cache()
+        """
+        HISTORY_CACHE.clear()